@@ -1,123 +1,118 @@
 import pandas as pd
 import numpy as np
+from numba import njit
 from typing import List, Tuple
 
+@njit(cache=True, error_model='numpy')
+def _find_violations(K, K_dfr, bid, ask, Sb_dfq, Sa_dfq, Sa, is_call, dirty):
+    """Fused bounds, vertical and butterfly checks over strike-sorted arrays.
+    K_dfr is the discounted strike vector K * df_r; Sb_dfq and Sa_dfq are the
+    dividend-discounted spot bid and ask.
+    Only positions flagged in `dirty` are re-checked. Returns a boolean mask
+    flagging violating positions."""
+    n = K.shape[0]
+    bad = np.zeros(n, dtype=np.bool_)
+    # Convexity legs: ask on the wings, bid in the middle for calls; the reverse for puts
+    wing = ask if is_call else bid
+    body = bid if is_call else ask
+
+    for i in range(n):
+        # Every check below only flags position i, and its outcome can only change
+        # when one of its neighbours changed since the previous pass
+        if not dirty[i]:
+            continue
+
+        # Rational bounds
+        if is_call:
+            lower_bound = max(Sb_dfq - K_dfr[i], 0.0)
+            upper_bound = Sa
+        else:
+            lower_bound = max(K_dfr[i] - Sa_dfq, 0.0)
+            upper_bound = K_dfr[i]
+        if bid[i] < lower_bound - 1e-10 or ask[i] > upper_bound + 1e-10:
+            bad[i] = True
+
+        # Monotonicity with the previous strike, the higher strike is flagged
+        if i > 0:
+            if is_call:
+                if ask[i-1] < bid[i]:
+                    bad[i] = True
+            elif bid[i-1] > ask[i]:
+                bad[i] = True
+
+        # Convexity and butterfly with both neighbours, the middle strike is flagged
+        if 0 < i < n - 1:
+            slope1 = (body[i] - wing[i-1]) / (K[i] - K[i-1])
+            slope2 = (wing[i+1] - body[i]) / (K[i+1] - K[i])
+            if slope1 > slope2 + 1e-10:
+                bad[i] = True
+            if abs((K[i] - K[i-1]) - (K[i+1] - K[i])) / K[i] <= 0.01:
+                if bid[i-1] - 2*ask[i] + bid[i+1] > 1e-10:
+                    bad[i] = True
+    return bad
+
+def _nearest_sorted(K: np.ndarray, x: float) -> int:
+    """Position of the strike closest to x in an ascending strike array (the lower strike on ties)."""
+    pos = np.searchsorted(K, x)
+    if pos == 0:
+        return 0
+    if pos == len(K) or x - K[pos-1] <= K[pos] - x:
+        return pos - 1
+    return pos
+
 class OptionsArbitrageCleaner:
     def __init__(self, spot_bid: float, spot_ask: float, r: float, T: float, q: float = 0.0):
         self.Sb, self.Sa = spot_bid, spot_ask
         self.r, self.T, self.q = r, T, q
         self.df_r = np.exp(-r * T)
         self.df_q = np.exp(-q * T)
+        self.Sb_dfq = self.Sb * self.df_q
+        self.Sa_dfq = self.Sa * self.df_q
 
     def identify_atm_strike(self, df: pd.DataFrame) -> float:
         """Identify the ATM strike (closest to spot mid)."""
         spot_mid = (self.Sb + self.Sa) / 2
-        strikes = df['strike'].values
+        strikes = df['strike'].to_numpy()
+        if np.all(strikes[:-1] <= strikes[1:]):
+            # Already sorted (the usual case for options chains): binary search
+            return strikes[_nearest_sorted(strikes, spot_mid)]
         atm_idx = np.argmin(np.abs(strikes - spot_mid))
         return strikes[atm_idx]
 
-    def _check_vertical_no_arb(self, df: pd.DataFrame, price_type: str) -> List[int]:
-        """Check monotonicity and convexity for 'call' or 'put'. Returns indices of violating rows."""
-        violations = []
-        df_sorted = df.sort_values('strike').reset_index(drop=True)
-        n = len(df_sorted)
-
-        # 1. Check Monotonicity
-        for i in range(n-1):
-            if price_type == 'call':
-                # Call ask at lower strike must be >= Call bid at higher strike
-                if df_sorted.loc[i, 'ask'] < df_sorted.loc[i+1, 'bid']:
-                    violations.append(df_sorted.index[i+1])
-            else:  # put
-                # Put bid at lower strike must be <= Put ask at higher strike
-                if df_sorted.loc[i, 'bid'] > df_sorted.loc[i+1, 'ask']:
-                    violations.append(df_sorted.index[i+1])
-
-        # 2. Check Convexity (for triplets)
-        for i in range(1, n-1):
-            K1, K2, K3 = df_sorted.loc[i-1, 'strike'], df_sorted.loc[i, 'strike'], df_sorted.loc[i+1, 'strike']
-            if price_type == 'call':
-                C1, C2, C3 = df_sorted.loc[i-1, 'ask'], df_sorted.loc[i, 'bid'], df_sorted.loc[i+1, 'ask']
-                slope1 = (C2 - C1) / (K2 - K1)
-                slope2 = (C3 - C2) / (K3 - K2)
-                if slope1 > slope2 + 1e-10:
-                    violations.append(df_sorted.index[i]) # Middle strike is problematic
-            else:  # put
-                P1, P2, P3 = df_sorted.loc[i-1, 'bid'], df_sorted.loc[i, 'ask'], df_sorted.loc[i+1, 'bid']
-                slope1 = (P2 - P1) / (K2 - K1)
-                slope2 = (P3 - P2) / (K3 - K2)
-                if slope1 > slope2 + 1e-10:
-                    violations.append(df_sorted.index[i])
-        return list(set(violations))
-
-    def _check_butterfly_no_arb(self, df: pd.DataFrame, price_type: str) -> List[int]:
-        """Check butterfly no-arbitrage condition. Returns violating middle strike indices."""
-        violations = []
-        df_sorted = df.sort_values('strike').reset_index(drop=True)
-        n = len(df_sorted)
-
-        for i in range(1, n-1):
-            K_prev, K, K_next = df_sorted.loc[i-1, 'strike'], df_sorted.loc[i, 'strike'], df_sorted.loc[i+1, 'strike']
-            # Check for approximate equal spacing
-            if abs((K - K_prev) - (K_next - K)) / K > 0.01:
-                continue # Skip non-equally spaced for simplicity
-
-            if price_type == 'call':
-                # Cost of long butterfly (using bids for long legs, asks for short leg)
-                cost = df_sorted.loc[i-1, 'bid'] - 2*df_sorted.loc[i, 'ask'] + df_sorted.loc[i+1, 'bid']
-                # If cost > 0, you can pay to get a non-negative future payoff -> arbitrage
-                if cost > 1e-10:
-                    violations.append(df_sorted.index[i])
-            else: # put
-                cost = df_sorted.loc[i-1, 'bid'] - 2*df_sorted.loc[i, 'ask'] + df_sorted.loc[i+1, 'bid']
-                if cost > 1e-10:
-                    violations.append(df_sorted.index[i])
-        return violations
-
-    def _check_bounds(self, df: pd.DataFrame, price_type: str) -> List[int]:
-        """Check if option prices are within rational bounds."""
-        violations = []
-        for idx, row in df.iterrows():
-            K = row['strike']
-            if price_type == 'call':
-                lower_bound = max(self.Sb * self.df_q - K * self.df_r, 0)
-                upper_bound = self.Sa
-                if row['bid'] < lower_bound - 1e-10 or row['ask'] > upper_bound + 1e-10:
-                    violations.append(idx)
-            else: # put
-                lower_bound = max(K * self.df_r - self.Sa * self.df_q, 0)
-                upper_bound = K * self.df_r
-                if row['bid'] < lower_bound - 1e-10 or row['ask'] > upper_bound + 1e-10:
-                    violations.append(idx)
-        return violations
-
     def clean_single_dataframe(self, df: pd.DataFrame, option_type: str, atm_strike: float, max_iter=20) -> pd.DataFrame:
         """Iteratively remove arbitrageable options from a single DataFrame."""
-        df_clean = df.copy()
-        atm_index = df_clean.index[df_clean['strike'] == atm_strike].tolist()[0]
+        # Sort once and track surviving rows by position instead of rebuilding the frame
+        df_sorted = df.sort_values('strike', kind='stable').reset_index(drop=True)
+        K = df_sorted['strike'].to_numpy(dtype=np.float64)
+        bid = df_sorted['bid'].to_numpy(dtype=np.float64)
+        ask = df_sorted['ask'].to_numpy(dtype=np.float64)
+        K_dfr = K * self.df_r # Reused by the bounds check on every iteration
+        alive = np.ones(len(df_sorted), dtype=bool)
+        atm_pos = _nearest_sorted(K, atm_strike)
+        # Surviving positions whose neighbours changed and need re-checking
+        dirty = np.ones(len(df_sorted), dtype=bool)
 
         for iteration in range(max_iter):
-            # Collect all potential violations
-            v_vertical = self._check_vertical_no_arb(df_clean, option_type)
-            v_butterfly = self._check_butterfly_no_arb(df_clean, option_type)
-            v_bounds = self._check_bounds(df_clean, option_type)
-
-            all_violations = set(v_vertical + v_butterfly + v_bounds)
-            all_violations.discard(atm_index) # Never remove the ATM anchor
-
-            if not all_violations:
+            # Collect all potential violations in a single fused pass
+            positions = np.flatnonzero(alive)
+            bad = _find_violations(
+                K[positions], K_dfr[positions], bid[positions], ask[positions],
+                self.Sb_dfq, self.Sa_dfq, self.Sa, option_type == 'call', dirty
+            )
+            bad &= positions != atm_pos # Never remove the ATM anchor
+
+            if not bad.any():
                 print(f"  Iteration {iteration+1}: Clean. No violations found.")
                 break
 
-            print(f"  Iteration {iteration+1}: Removing {len(all_violations)} violating options.")
-            df_clean = df_clean.drop(index=list(all_violations)).reset_index(drop=True)
-            # Re-identify ATM index in the new dataframe if it still exists
-            if atm_strike in df_clean['strike'].values:
-                atm_index = df_clean.index[df_clean['strike'] == atm_strike].tolist()[0]
-            else:
-                print("  Warning: ATM strike was removed. This shouldn't happen if data is sane.")
-                break
-        return df_clean
+            print(f"  Iteration {iteration+1}: Removing {np.count_nonzero(bad)} violating options.")
+            alive[positions[bad]] = False
+            # Survivors next to a removed option get a new neighbour
+            neighbour_removed = np.zeros_like(bad)
+            neighbour_removed[1:] |= bad[:-1]
+            neighbour_removed[:-1] |= bad[1:]
+            dirty = neighbour_removed[~bad]
+        return df_sorted[alive].reset_index(drop=True)
 
 def clean_all_dataframes(list_of_dfs: List[pd.DataFrame],
                          option_types: List[str],
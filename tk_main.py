@@ -1,32 +1,41 @@
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from volatilitypopup import VolatilityPopup
 
+# Volatility columns, in the column order of the surface arrays
+_VOL_KEYS = ("ATM", "10D", "25D")
+
 class VolatilityTableApp:
+    MATURITIES: Tuple[str, ...] = ("1D", "2D", "1W", "2W", "1M", "3M", "6M", "1Y")
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Volatility Surface Manager")
         self.root.geometry("1000x600")
         
-        # Initialize data structures
-        self.volatility_data: Dict[str, Dict[str, float]] = {
-            "1D": {"ATM": 15.2, "10D": 16.5, "25D": 14.8, "Offset": 0.0},
-            "2D": {"ATM": 15.0, "10D": 16.3, "25D": 14.6, "Offset": 0.0},
-            "1W": {"ATM": 14.8, "10D": 16.1, "25D": 14.4, "Offset": 0.0},
-            "2W": {"ATM": 14.6, "10D": 15.9, "25D": 14.2, "Offset": 0.0},
-            "1M": {"ATM": 14.4, "10D": 15.7, "25D": 14.0, "Offset": 0.0},
-            "3M": {"ATM": 14.2, "10D": 15.5, "25D": 13.8, "Offset": 0.0},
-            "6M": {"ATM": 14.0, "10D": 15.3, "25D": 13.6, "Offset": 0.0},
-            "1Y": {"ATM": 13.8, "10D": 15.1, "25D": 13.4, "Offset": 0.0},
-        }
-        
-        self.original_volatility_data = {
-            maturity: {k: v for k, v in values.items() if k != "Offset"}
-            for maturity, values in self.volatility_data.items()
-        }
+        # Initialize data structures: the surface is kept as parallel arrays
+        # indexed by maturity code (position in MATURITIES), with columns _VOL_KEYS
+        self._mat_code: Dict[str, int] = {m: i for i, m in enumerate(self.MATURITIES)}
+        self._orig = np.array([
+            [15.2, 16.5, 14.8],
+            [15.0, 16.3, 14.6],
+            [14.8, 16.1, 14.4],
+            [14.6, 15.9, 14.2],
+            [14.4, 15.7, 14.0],
+            [14.2, 15.5, 13.8],
+            [14.0, 15.3, 13.6],
+            [13.8, 15.1, 13.4],
+        ])
+        self._offset = np.zeros(len(self.MATURITIES))
+        self._current = self._orig.copy()
+        # (code, offset) awaiting confirmation in the VolatilityPopup
+        self._pending_offset: Optional[Tuple[int, float]] = None
         
         self.setup_ui()
+        self.root.bind("<<VolConfirmed>>", self._on_vol_confirmed)
+        self.root.bind("<<VolCancelled>>", self._on_vol_cancelled)
         
     def setup_ui(self) -> None:
         """Initialize all UI components."""
@@ -34,16 +43,21 @@ class VolatilityTableApp:
         self.create_main_frame()
         self.create_table()
         self.create_controls()
+        self.create_status_bar()
         
     def setup_styles(self) -> None:
-        """Configure custom styles for the application."""
-        style = ttk.Style()
+        """Configure custom styles for the application (once per Tcl interpreter)."""
+        # The marker lives in the interpreter, as ttk styles do
+        if self.root.tk.call("info", "exists", "::vol_app_styled"):
+            return
+        style = ttk.Style(self.root)
         style.configure("TFrame", background="#f0f0f0")
         style.configure("TButton", padding=6, font=("Arial", 10))
         style.configure("Header.TLabel", font=("Arial", 10, "bold"), padding=5)
         style.configure("Normal.TLabel", font=("Arial", 10), padding=5)
         style.configure("Offset.TLabel", font=("Arial", 10), padding=5, background="#d3d3d3")
         style.configure("OffsetActive.TLabel", font=("Arial", 10), padding=5, background="#ffa500")
+        self.root.tk.call("set", "::vol_app_styled", 1)
         
     def create_main_frame(self) -> None:
         """Create the main container frame."""
@@ -57,7 +71,7 @@ class VolatilityTableApp:
         table_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # Table headers
-        headers = ["Maturity", "ATM", "10D", "25D", "Offset"]
+        headers = ["Maturity", *_VOL_KEYS, "Offset"]
         
         # Create header row
         for col, header in enumerate(headers):
@@ -66,34 +80,44 @@ class VolatilityTableApp:
             table_frame.grid_columnconfigure(col, weight=1)
         
         # Create data rows
-        self.offset_entries: Dict[str, tk.StringVar] = {}
-        self.offset_cells: Dict[str, ttk.Label] = {}
+        self.offset_entries: List[tk.StringVar] = []
+        self.offset_cells: List[ttk.Label] = []
+        self.vol_cells: Dict[Tuple[int, int], ttk.Label] = {}
         
-        for row, maturity in enumerate(self.volatility_data.keys(), start=1):
+        for i, maturity in enumerate(self.MATURITIES):
+            row = i + 1
+            
             # Maturity column
             ttk.Label(table_frame, text=maturity, style="Normal.TLabel").grid(
                 row=row, column=0, sticky="nsew", padx=1, pady=1
             )
             
             # Volatility columns
-            for col, vol_type in enumerate(["ATM", "10D", "25D"], start=1):
-                ttk.Label(table_frame, 
-                          text=f"{self.volatility_data[maturity][vol_type]:.1f}", 
-                          style="Normal.TLabel").grid(
-                    row=row, column=col, sticky="nsew", padx=1, pady=1
-                )
+            for j in range(len(_VOL_KEYS)):
+                vol_cell = ttk.Label(table_frame, 
+                                     text=f"{self._current[i, j]:.1f}", 
+                                     style="Normal.TLabel")
+                vol_cell.grid(row=row, column=j + 1, sticky="nsew", padx=1, pady=1)
+                self.vol_cells[(i, j)] = vol_cell
             
             # Offset column
-            offset_var = tk.StringVar(value=f"{self.volatility_data[maturity]['Offset']:.1f}")
-            self.offset_entries[maturity] = offset_var
+            offset_var = tk.StringVar(value=f"{self._offset[i]:.1f}")
+            self.offset_entries.append(offset_var)
             
             offset_cell = ttk.Label(table_frame, textvariable=offset_var, 
                                    style="Offset.TLabel")
             offset_cell.grid(row=row, column=4, sticky="nsew", padx=1, pady=1)
-            self.offset_cells[maturity] = offset_cell
+            self.offset_cells.append(offset_cell)
             
             # Make offset cell respond to clicks
-            offset_cell.bind("<Button-1>", lambda e, m=maturity: self.edit_offset(m))
+            offset_cell.bind("<Button-1>", lambda e, i=i: self.edit_offset(i))
+        
+        # Single entry widget reused for every offset edit, shown over the clicked cell
+        self._editing_code: Optional[int] = None
+        self._edit_entry = ttk.Entry(table_frame, width=8, font=("Arial", 10), justify=tk.CENTER)
+        self._edit_entry.grid_remove()
+        self._edit_entry.bind("<Return>", self.save_offset)
+        self._edit_entry.bind("<FocusOut>", self.save_offset)
         
     def create_controls(self) -> None:
         """Create control buttons and selection widgets."""
@@ -104,7 +128,7 @@ class VolatilityTableApp:
         ttk.Label(control_frame, text="Apply to Maturity:").pack(side=tk.LEFT, padx=(0, 5))
         self.maturity_var = tk.StringVar(value="1D")
         maturity_menu = ttk.OptionMenu(
-            control_frame, self.maturity_var, "1D", *self.volatility_data.keys()
+            control_frame, self.maturity_var, "1D", *self.MATURITIES
         )
         maturity_menu.pack(side=tk.LEFT, padx=(0, 20))
         
@@ -120,106 +144,121 @@ class VolatilityTableApp:
         
         reset_button = ttk.Button(control_frame, text="Reset All", command=self.reset_all)
         reset_button.pack(side=tk.LEFT)
+        
+    def create_status_bar(self) -> None:
+        """Create the status label used to report popup outcomes."""
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self.main_frame, textvariable=self.status_var).pack(fill=tk.X, pady=(10, 0))
     ##this
-    def edit_offset(self, maturity: str) -> None:
-        """Enable editing of the offset value for a specific maturity."""
-        # Create a temporary entry widget for editing
-        cell = self.offset_cells[maturity]
-        x, y, width, height = cell.grid_info()['column'], cell.grid_info()['row'], cell.winfo_width(), cell.winfo_height()
-        
-        entry_frame = cell.master
-        entry = ttk.Entry(entry_frame, width=8, font=("Arial", 10), justify=tk.CENTER)
-        entry.insert(0, self.offset_entries[maturity].get())
-        entry.grid(row=y, column=x, sticky="nsew", padx=1, pady=1)
-        entry.focus_set()
-        
-        def save_offset(event=None):
-            try:
-                new_value = float(entry.get())
-                self.offset_entries[maturity].set(f"{new_value:.1f}")
-                self.update_offset_cell_color(maturity)
-            except ValueError:
-                pass
-            entry.destroy()
-        ##this
-        entry.bind("<Return>", save_offset)
-        entry.bind("<FocusOut>", save_offset)
+    def edit_offset(self, code: int) -> None:
+        """Enable editing of the offset value for the maturity with the given code."""
+        # Clicking a label does not move focus, so save any edit still in progress
+        if self._editing_code is not None:
+            self.save_offset()
+        info = self.offset_cells[code].grid_info()
+        self._edit_entry.delete(0, tk.END)
+        self._edit_entry.insert(0, self.offset_entries[code].get())
+        self._edit_entry.grid(row=info['row'], column=info['column'], sticky="nsew", padx=1, pady=1)
+        self._editing_code = code
+        self._edit_entry.focus_set()
+        
+    def save_offset(self, event=None) -> None:
+        """Store the edited offset and hide the edit entry."""
+        code = self._editing_code
+        if code is None:
+            return  # <FocusOut> after <Return> already saved
+        self._editing_code = None
+        try:
+            new_value = float(self._edit_entry.get())
+            self.offset_entries[code].set(f"{new_value:.1f}")
+            self.update_offset_cell_color(code)
+        except ValueError:
+            pass
+        self._edit_entry.grid_remove()
     
     def apply_offset(self) -> None:
         """Apply the offset to the selected maturity."""
         maturity = self.maturity_var.get()
+        code = self._mat_code[maturity]
         
         try:
             offset_value = float(self.offset_entry.get())
+            # Nothing to confirm or refresh if this offset is already applied and shown;
+            # the offset cell can be edited separately from the applied value
+            if (offset_value == self._offset[code]
+                    and self.offset_entries[code].get() == f"{offset_value:.1f}"):
+                self.status_var.set(f"Offset already applied to {maturity}.")
+                return
 
             # Calculate new values
-            new_values = {
-                vol_type: self.original_volatility_data[maturity][vol_type] + offset_value
-                for vol_type in ["ATM", "10D", "25D"]
-            }
+            original_values = dict(zip(_VOL_KEYS, self._orig[code].tolist()))
+            new_values = dict(zip(_VOL_KEYS, (self._orig[code] + offset_value).tolist()))
 
-            # Show confirmation popup
+            # Show confirmation popup, the offset is applied in _on_vol_confirmed
+            self._pending_offset = (code, offset_value)
             VolatilityPopup(
                 self.root,
                 maturity,
-                self.original_volatility_data[maturity],
+                original_values,
                 new_values,
                 offset_value
             )
 
-            # Only update if user confirms (move this to popup's on_confirm)
-            self.offset_entries[maturity].set(f"{offset_value:.1f}")
-            self.update_offset_cell_color(maturity)
-            self.update_volatilities(maturity, offset_value)
-
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid number", parent=self.root)
+    
+    def _on_vol_confirmed(self, event=None) -> None:
+        """Apply the pending offset once the user confirms it in the popup."""
+        if self._pending_offset is None:
+            return
+        code, offset_value = self._pending_offset
+        self._pending_offset = None
+        
+        self.offset_entries[code].set(f"{offset_value:.1f}")
+        self.update_offset_cell_color(code)
+        self.update_volatilities(code, offset_value)
+        self.status_var.set(f"Volatility adjustment for {self.MATURITIES[code]} has been applied.")
+    
+    def _on_vol_cancelled(self, event=None) -> None:
+        """Drop the pending offset when the user cancels the popup."""
+        self._pending_offset = None
+        self.status_var.set("No changes were made.")
 
         
-    def update_volatilities(self, maturity: str, offset: float) -> None:
+    def update_volatilities(self, code: int, offset: float) -> None:
         """Update volatility values based on the applied offset."""
-        # Update ATM vol
-        atm_vol = self.original_volatility_data[maturity]["ATM"] + offset
-        self.volatility_data[maturity]["ATM"] = atm_vol
-        
-        # Update other vols (here we just add the same offset, but you could implement more complex logic)
-        for vol_type in ["10D", "25D"]:
-            self.volatility_data[maturity][vol_type] = (
-                self.original_volatility_data[maturity][vol_type] + offset
-            )
+        # Here we just add the same offset to every vol, but you could implement more complex logic
+        self._offset[code] = offset
+        self._current[code] = self._orig[code] + offset
         
         # Refresh the table
         self.refresh_table()
         
     def refresh_table(self) -> None:
         """Refresh the table with updated volatility values."""
-        table_frame = self.offset_cells["1D"].master  # Get reference to the table frame
-        
-        for row, maturity in enumerate(self.volatility_data.keys(), start=1):
-            for col, vol_type in enumerate(["ATM", "10D", "25D"], start=1):
-                # Find the label widget in the grid and update its text
-                for child in table_frame.grid_slaves(row=row, column=col):
-                    if isinstance(child, ttk.Label):
-                        child.config(text=f"{self.volatility_data[maturity][vol_type]:.1f}")
-                        break
+        # Convert the whole surface to Python floats in one pass, then format
+        texts = [[f"{v:.1f}" for v in row] for row in self._current.tolist()]
+        for (i, j), vol_cell in self.vol_cells.items():
+            vol_cell.config(text=texts[i][j])
         
-    def update_offset_cell_color(self, maturity: str) -> None:
+    def update_offset_cell_color(self, code: int) -> None:
         """Update the background color of the offset cell based on its value."""
         try:
-            offset_value = float(self.offset_entries[maturity].get())
+            offset_value = float(self.offset_entries[code].get())
             if offset_value == 0:
-                self.offset_cells[maturity].configure(style="Offset.TLabel")
+                self.offset_cells[code].configure(style="Offset.TLabel")
             else:
-                self.offset_cells[maturity].configure(style="OffsetActive.TLabel")
+                self.offset_cells[code].configure(style="OffsetActive.TLabel")
         except ValueError:
             pass
         
     def reset_all(self) -> None:
         """Reset all offsets to zero and revert to original volatility values."""
-        for maturity in self.volatility_data.keys():
-            self.offset_entries[maturity].set("0.0")
-            self.update_offset_cell_color(maturity)
-            self.volatility_data[maturity].update(self.original_volatility_data[maturity])
+        self._current[:] = self._orig
+        self._offset[:] = 0
+        for code, offset_var in enumerate(self.offset_entries):
+            offset_var.set("0.0")
+            self.update_offset_cell_color(code)
         
         self.refresh_table()
         self.offset_entry.delete(0, tk.END)
@@ -1,39 +1,43 @@
+import re
+import tkinter as tk
 from tkinter import ttk, messagebox
-def edit_offset(self, maturity: str) -> None:
-    """Enable editing of the offset value for a specific maturity."""
-    cell = self.offset_cells[maturity]
-    
+
+# Any prefix of a signed decimal number, so partially typed values are accepted
+_OFFSET_RE = re.compile(r'-?\d*(\.\d*)?')
+
+def edit_offset(self, code: int) -> None:
+    """Enable editing of the offset value for the maturity with the given code."""
+    cell = self.offset_cells[code]
+
     # Create a temporary validated entry
     entry = ttk.Entry(
         cell.master,
         validate="key",
         validatecommand=(cell.master.register(
-            lambda proposed_value, m=maturity: self.validate_offset(proposed_value, m)
-        , '%P'),
+            lambda proposed_value, c=code: self.validate_offset(proposed_value, c)
+        ), '%P'),
         font=("Arial", 10),
         justify=tk.CENTER
     )
-    
-    entry.insert(0, self.offset_entries[maturity].get())
-    entry.grid(row=cell.grid_info()['row'], column=cell.grid_info()['column'], 
+
+    entry.insert(0, self.offset_entries[code].get())
+    entry.grid(row=cell.grid_info()['row'], column=cell.grid_info()['column'],
                sticky="nsew", padx=1, pady=1)
     entry.focus_set()
-    
+
     def save_offset(event=None):
-        if self.validate_offset(entry.get(), maturity):
-            self.offset_entries[maturity].set(entry.get())
-            self.update_offset_cell_color(maturity)
+        # Keystroke validation accepts prefixes like "-" or ".", so parse the final value
+        try:
+            new_value = float(entry.get())
+            self.offset_entries[code].set(f"{new_value:.1f}")
+            self.update_offset_cell_color(code)
+        except ValueError:
+            pass
         entry.destroy()
-    
+
     entry.bind("<Return>", save_offset)
     entry.bind("<FocusOut>", save_offset)
 
-def validate_offset(self, proposed_value: str, maturity: str) -> bool:
+def validate_offset(self, proposed_value: str, code: int) -> bool:
     """Validate the offset value."""
-    try:
-        if proposed_value == "":
-            return True
-        float(proposed_value)
-        return True
-    except ValueError:
-        return False
\ No newline at end of file
+    return proposed_value == "" or _OFFSET_RE.fullmatch(proposed_value) is not None
@@ -1,8 +1,9 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from typing import Dict
 
 class VolatilityPopup:
+
     def __init__(self, parent, maturity: str, original_values: Dict[str, float], 
                  new_values: Dict[str, float], offset: float):
         self.parent = parent
@@ -11,15 +12,35 @@ class VolatilityPopup:
         self.new_values = new_values
         self.offset = offset
         
+        self.setup_styles()
         self.create_popup()
         self.create_widgets()
         
+    def setup_styles(self):
+        """Register the popup label styles (once per Tcl interpreter)."""
+        # The marker lives in the interpreter, as ttk styles do
+        if self.parent.tk.call("info", "exists", "::vol_popup_styled"):
+            return
+        style = ttk.Style(self.parent)
+        cell = dict(borderwidth=1, relief="solid", padding=5)
+        style.configure("PopTitle.TLabel", font=("Arial", 12, "bold"))
+        style.configure("PopText.TLabel", font=("Arial", 10))
+        style.configure("PopHeader.TLabel", font=("Arial", 10, "bold"), **cell)
+        style.configure("PopCell.TLabel", font=("Arial", 10), **cell)
+        style.configure("PopNew.TLabel", font=("Arial", 10, "bold"), background="#e6f3ff", **cell)
+        style.configure("PopChangeUp.TLabel", font=("Arial", 10), foreground="white",
+                        background="#4CAF50", **cell)
+        style.configure("PopChangeDown.TLabel", font=("Arial", 10), foreground="white",
+                        background="#F44336", **cell)
+        self.parent.tk.call("set", "::vol_popup_styled", 1)
+        
     def create_popup(self):
         self.popup = tk.Toplevel(self.parent)
         self.popup.title("Volatility Adjustment Confirmation")
         self.popup.geometry("400x300")
         self.popup.resizable(False, False)
         self.popup.grab_set()  # Make it modal
+        self.popup.protocol("WM_DELETE_WINDOW", self.on_cancel)  # Closing the window cancels
         
         # Center the popup relative to parent
         parent_x = self.parent.winfo_x()
@@ -47,7 +68,7 @@ class VolatilityPopup:
         ttk.Label(
             title_frame, 
             text=f"Volatility Adjustment for {self.maturity}",
-            font=("Arial", 12, "bold")
+            style="PopTitle.TLabel"
         ).pack(side=tk.LEFT)
         
         # Offset info
@@ -57,7 +78,7 @@ class VolatilityPopup:
         ttk.Label(
             offset_frame,
             text=f"Applied Offset: {self.offset:+.1f}",
-            font=("Arial", 10)
+            style="PopText.TLabel"
         ).pack(side=tk.LEFT)
         
         # Volatility comparison table
@@ -67,65 +88,28 @@ class VolatilityPopup:
         # Table headers
         headers = ["Type", "Original", "New", "Change"]
         for col, header in enumerate(headers):
-            ttk.Label(
-                table_frame,
-                text=header,
-                font=("Arial", 10, "bold"),
-                borderwidth=1,
-                relief="solid",
-                padding=5
-            ).grid(row=0, column=col, sticky="nsew")
+            ttk.Label(table_frame, text=header, style="PopHeader.TLabel").grid(
+                row=0, column=col, sticky="nsew"
+            )
             
         # Table data
-        vol_types = ["ATM", "10D", "25D"]
-        for row, vol_type in enumerate(vol_types, start=1):
-            original = self.original_values[vol_type]
+        # Rows follow the caller's key order
+        for row, (vol_type, original) in enumerate(self.original_values.items(), start=1):
             new = self.new_values[vol_type]
             change = new - original
+            # Change is colored based on direction, new value is highlighted
+            change_style = "PopChangeUp.TLabel" if change >= 0 else "PopChangeDown.TLabel"
             
-            # Type column
-            ttk.Label(
-                table_frame,
-                text=vol_type,
-                font=("Arial", 10),
-                borderwidth=1,
-                relief="solid",
-                padding=5
-            ).grid(row=row, column=0, sticky="nsew")
-            
-            # Original value
-            ttk.Label(
-                table_frame,
-                text=f"{original:.1f}",
-                font=("Arial", 10),
-                borderwidth=1,
-                relief="solid",
-                padding=5
-            ).grid(row=row, column=1, sticky="nsew")
-            
-            # New value (highlighted)
-            ttk.Label(
-                table_frame,
-                text=f"{new:.1f}",
-                font=("Arial", 10, "bold"),
-                background="#e6f3ff",
-                borderwidth=1,
-                relief="solid",
-                padding=5
-            ).grid(row=row, column=2, sticky="nsew")
-            
-            # Change (colored based on direction)
-            change_color = "#4CAF50" if change >= 0 else "#F44336"
-            ttk.Label(
-                table_frame,
-                text=f"{change:+.1f}",
-                font=("Arial", 10),
-                foreground="white",
-                background=change_color,
-                borderwidth=1,
-                relief="solid",
-                padding=5
-            ).grid(row=row, column=3, sticky="nsew")
+            cells = [
+                (vol_type, "PopCell.TLabel"),
+                (f"{original:.1f}", "PopCell.TLabel"),
+                (f"{new:.1f}", "PopNew.TLabel"),
+                (f"{change:+.1f}", change_style),
+            ]
+            for col, (text, style) in enumerate(cells):
+                ttk.Label(table_frame, text=text, style=style).grid(
+                    row=row, column=col, sticky="nsew"
+                )
             
         # Configure grid weights
         for col in range(4):
@@ -148,20 +132,13 @@ class VolatilityPopup:
         ).pack(side=tk.RIGHT)
         
     def on_confirm(self):
+        # Let the parent apply the adjustment and report it, no second dialog
         self.popup.destroy()
-        messagebox.showinfo(
-            "Confirmed",
-            f"Volatility adjustment for {self.maturity} has been applied.",
-            parent=self.parent
-        )
+        self.parent.event_generate("<<VolConfirmed>>")
         
     def on_cancel(self):
         self.popup.destroy()
-        messagebox.showinfo(
-            "Cancelled",
-            "No changes were made.",
-            parent=self.parent
-        )
+        self.parent.event_generate("<<VolCancelled>>")
 
 
 # Example usage: